@@ -51,9 +51,11 @@ export class GenerateGardenUseCase {
 
       logger.info('Generando huerto con algoritmo mejorado', { request: normalizedRequest });
 
-      // 2. Cargar plantas y matriz de compatibilidad
-      const plants = await this.plantRepository.findAll();
-      const compatibilityMatrix = await this.compatibilityMatrixRepository.getAllCompatibilities();
+      // 2. Cargar plantas y matriz de compatibilidad (consultas independientes, en paralelo)
+      const [plants, compatibilityMatrix] = await Promise.all([
+        this.plantRepository.findAll(),
+        this.compatibilityMatrixRepository.getAllCompatibilities(),
+      ]);
 
       // 3. Configurar calculador de fitness MEJORADO
       const fitnessCalculator = new FitnessCalculator({
@@ -170,7 +172,7 @@ export class GenerateGardenUseCase {
     individual: Individual,
     rank: number,
     rawCalendar: any,
-    compatibilityMatrix: Map<string, Map<string, number>>
+    compatibilityMatrix: ReadonlyMap<string, ReadonlyMap<string, number>>
   ): SolutionDto {
     // Calcular estimaciones
     const estimations = this.calculateEstimations(individual);
@@ -179,27 +181,7 @@ export class GenerateGardenUseCase {
     const compatibilityList = this.extractCompatibilityList(individual, compatibilityMatrix);
 
     // Calcular breakdown de categorías
-    const categoryBreakdown: Record<string, number> = {
-      vegetable: 0,
-      medicinal: 0,
-      aromatic: 0,
-      ornamental: 0,
-    };
-
-    individual.plants.forEach(p => {
-      p.plant.type.forEach(type => {
-        if (type in categoryBreakdown) {
-          categoryBreakdown[type] += 1; // Cada instancia = 1 planta
-        }
-      });
-    });
-
-    const total = Object.values(categoryBreakdown).reduce((sum, v) => sum + v, 0);
-    if (total > 0) {
-      Object.keys(categoryBreakdown).forEach(key => {
-        categoryBreakdown[key] = Math.round((categoryBreakdown[key] / total) * 100);
-      });
-    }
+    const categoryBreakdown = individual.getCategoryBreakdown();
 
     // Transformar calendario al formato del DTO
     const calendar = {
@@ -245,13 +227,17 @@ export class GenerateGardenUseCase {
    * Calcula estimaciones de producción, agua, costo y mantenimiento.
    */
   private calculateEstimations(individual: Individual) {
-    const vegetableArea = individual.plants
-      .filter(p => p.plant.hasType('vegetable'))
-      .reduce((sum, p) => sum + p.totalArea, 0);
+    // Área comestible, agua y costo acumulados en una sola pasada
+    let vegetableArea = 0;
+    let weeklyWaterLiters = 0;
+    let implementationCostMXN = 0;
+    for (const p of individual.plants) {
+      if (p.plant.isEdible()) vegetableArea += p.totalArea;
+      weeklyWaterLiters += p.totalWeeklyWater;
+      implementationCostMXN += p.totalCost;
+    }
     const monthlyProductionKg = vegetableArea * 2;
 
-    const weeklyWaterLiters = individual.totalWeeklyWater;
-    const implementationCostMXN = individual.totalCost;
     const maintenanceMinutesPerWeek = individual.totalPlants * 15;
 
     return {
@@ -267,16 +253,22 @@ export class GenerateGardenUseCase {
    */
   private extractCompatibilityList(
     individual: Individual,
-    compatibilityMatrix: Map<string, Map<string, number>>
+    compatibilityMatrix: ReadonlyMap<string, ReadonlyMap<string, number>>
   ) {
     const compatibilities: SolutionDto['compatibilityMatrix'] = [];
 
-    for (let i = 0; i < individual.plants.length; i++) {
-      for (let j = i + 1; j < individual.plants.length; j++) {
-        const plant1 = individual.plants[i].plant.species;
-        const plant2 = individual.plants[j].plant.species;
+    const plants = individual.plants;
+
+    for (let i = 0; i < plants.length; i++) {
+      const plant1 = plants[i].plant.species;
+      // Fila de la primera planta resuelta una vez; solo la orientación
+      // directa (plant1 → plant2), sin datos = neutral
+      const row = compatibilityMatrix.get(plant1);
+
+      for (let j = i + 1; j < plants.length; j++) {
+        const plant2 = plants[j].plant.species;
 
-        const score = compatibilityMatrix.get(plant1)?.get(plant2) || 0;
+        const score = row?.get(plant2) || 0;
 
         const relation = score > 0.5 ? 'benefica' : score < -0.5 ? 'perjudicial' : 'neutral';
 
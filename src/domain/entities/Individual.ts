@@ -1,4 +1,5 @@
 import { PlantInstance } from './PlantInstance';
+import { PlantCategory } from './Plant';
 import { Dimensions } from '../value-objects/Dimensions';
 import { Metrics } from '../value-objects/Metrics';
 
@@ -33,7 +34,9 @@ export class Individual {
   }
 
   get usedArea(): number {
-    return this.plants.reduce((sum, p) => sum + p.totalArea, 0);
+    let total = 0;
+    for (const p of this.plants) total += p.totalArea;
+    return total;
   }
 
   get availableArea(): number {
@@ -41,11 +44,56 @@ export class Individual {
   }
 
   get totalWeeklyWater(): number {
-    return this.plants.reduce((sum, p) => sum + p.totalWeeklyWater, 0);
+    let total = 0;
+    for (const p of this.plants) total += p.totalWeeklyWater;
+    return total;
   }
 
   get totalCost(): number {
-    return this.plants.reduce((sum, p) => sum + p.totalCost, 0);
+    let total = 0;
+    for (const p of this.plants) total += p.totalCost;
+    return total;
+  }
+
+  /**
+   * Porcentaje (redondeado) de plantas por categoría
+   */
+  getCategoryBreakdown(): Record<string, number> {
+    return Individual.categoryBreakdownOf(this.plants);
+  }
+
+  /**
+   * Porcentaje (redondeado) de plantas por categoría de un conjunto de
+   * instancias, contando con la máscara de categorías en una sola pasada.
+   * Cada instancia = 1 planta; una planta con varios tipos cuenta en cada
+   * uno. Sin plantas categorizadas devuelve todo en 0.
+   */
+  static categoryBreakdownOf(plants: PlantInstance[]): Record<string, number> {
+    let vegetable = 0;
+    let medicinal = 0;
+    let aromatic = 0;
+    let ornamental = 0;
+
+    for (const plantInstance of plants) {
+      const mask = plantInstance.plant.categoryMask;
+      if (mask & PlantCategory.vegetable) vegetable++;
+      if (mask & PlantCategory.medicinal) medicinal++;
+      if (mask & PlantCategory.aromatic) aromatic++;
+      if (mask & PlantCategory.ornamental) ornamental++;
+    }
+
+    const total = vegetable + medicinal + aromatic + ornamental;
+    if (total === 0) {
+      return { vegetable: 0, medicinal: 0, aromatic: 0, ornamental: 0 };
+    }
+
+    // Convertir a porcentajes
+    return {
+      vegetable: Math.round((vegetable / total) * 100),
+      medicinal: Math.round((medicinal / total) * 100),
+      aromatic: Math.round((aromatic / total) * 100),
+      ornamental: Math.round((ornamental / total) * 100),
+    };
   }
 
   /**
@@ -1,6 +1,7 @@
 import { Dimensions } from '../value-objects/Dimensions';
 import { Metrics } from '../value-objects/Metrics';
 import { PlantInstance } from './PlantInstance';
+import { Individual } from './Individual';
 
 export interface OrchardCalendar {
   season: string;
@@ -72,7 +73,9 @@ export class Orchard {
   }
 
   get usedArea(): number {
-    return this.plants.reduce((sum, p) => sum + p.totalArea, 0);
+    let total = 0;
+    for (const p of this.plants) total += p.totalArea;
+    return total;
   }
 
   get availableArea(): number {
@@ -80,30 +83,7 @@ export class Orchard {
   }
 
   getCategoryBreakdown(): Record<string, number> {
-    const breakdown: Record<string, number> = {
-      vegetable: 0,
-      medicinal: 0,
-      aromatic: 0,
-      ornamental: 0,
-    };
-
-    this.plants.forEach(plantInstance => {
-      plantInstance.plant.type.forEach(type => {
-        if (type in breakdown) {
-          breakdown[type] += 1; // Cada instancia = 1 planta
-        }
-      });
-    });
-
-    const total = Object.values(breakdown).reduce((sum, count) => sum + count, 0);
-    if (total === 0) return breakdown;
-
-    // Convertir a porcentajes
-    Object.keys(breakdown).forEach(key => {
-      breakdown[key] = Math.round((breakdown[key] / total) * 100);
-    });
-
-    return breakdown;
+    return Individual.categoryBreakdownOf(this.plants);
   }
 
   toJSON() {
@@ -12,6 +12,43 @@ export interface PlantProps {
   size: number;
 }
 
+/**
+ * Bits de categoría: cada planta guarda sus tipos conocidos como una máscara
+ * para contarlos sin comparar cadenas en el cálculo de fitness.
+ */
+export const PlantCategory = {
+  vegetable: 1 << 0,
+  medicinal: 1 << 1,
+  aromatic: 1 << 2,
+  ornamental: 1 << 3,
+} as const;
+
+/**
+ * Bit de una categoría conocida, o 0 si el tipo no es una de ellas.
+ */
+function categoryBit(type: string): number {
+  switch (type) {
+    case 'vegetable':
+      return PlantCategory.vegetable;
+    case 'medicinal':
+      return PlantCategory.medicinal;
+    case 'aromatic':
+      return PlantCategory.aromatic;
+    case 'ornamental':
+      return PlantCategory.ornamental;
+    default:
+      return 0;
+  }
+}
+
+function toCategoryMask(types: string[]): number {
+  let mask = 0;
+  for (const type of types) {
+    mask |= categoryBit(type);
+  }
+  return mask;
+}
+
 export class Plant {
   public readonly id: number;
   public readonly species: string;
@@ -24,6 +61,12 @@ export class Plant {
   public readonly waterPerKg: number;
   public readonly benefits: string[];
   public readonly size: number;
+  public readonly categoryMask: number;
+  /**
+   * Lado del cuadrado que ocupa la planta (sqrt(size)), precalculado porque
+   * se usa en cada validación de espaciamiento y posición del AG
+   */
+  public readonly sideLength: number;
 
   constructor(props: PlantProps) {
     this.id = props.id;
@@ -37,26 +80,30 @@ export class Plant {
     this.waterPerKg = props.waterPerKg;
     this.benefits = props.benefits;
     this.size = props.size;
+    this.categoryMask = toCategoryMask(props.type);
+    this.sideLength = Math.sqrt(props.size);
   }
 
   hasType(type: string): boolean {
-    return this.type.includes(type);
+    // Las categorías conocidas se resuelven con la máscara precalculada
+    const bit = categoryBit(type);
+    return bit !== 0 ? (this.categoryMask & bit) !== 0 : this.type.includes(type);
   }
 
   isMedicinal(): boolean {
-    return this.hasType('medicinal');
+    return (this.categoryMask & PlantCategory.medicinal) !== 0;
   }
 
   isEdible(): boolean {
-    return this.hasType('vegetable');
+    return (this.categoryMask & PlantCategory.vegetable) !== 0;
   }
 
   isAromatic(): boolean {
-    return this.hasType('aromatic');
+    return (this.categoryMask & PlantCategory.aromatic) !== 0;
   }
 
   isOrnamental(): boolean {
-    return this.hasType('ornamental');
+    return (this.categoryMask & PlantCategory.ornamental) !== 0;
   }
 
   estimatedCost(): number {
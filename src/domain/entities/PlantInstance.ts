@@ -19,6 +19,11 @@ export interface PlantInstanceProps {
   status?: 'pending' | 'planted' | 'growing' | 'harvest_ready' | 'harvested';
 }
 
+/**
+ * Rotaciones permitidas (en grados)
+ */
+const VALID_ROTATIONS: ReadonlySet<number> = new Set([0, 90, 180, 270]);
+
 export class PlantInstance {
   public readonly plant: Plant;
   public readonly position: Position;
@@ -34,13 +39,13 @@ export class PlantInstance {
 
     // Calcular dimensiones basadas en el tamaño real de la planta
     // Si plant.size = 2.0 m², entonces width = height = sqrt(2.0) ≈ 1.41m
-    const calculatedDimension = Math.sqrt(props.plant.size);
+    const calculatedDimension = props.plant.sideLength;
     this.width = props.width ?? calculatedDimension;
     this.height = props.height ?? calculatedDimension;
 
     // Validar rotación
     this.rotation = props.rotation ?? 0;
-    if (![0, 90, 180, 270].includes(this.rotation)) {
+    if (!VALID_ROTATIONS.has(this.rotation)) {
       throw new Error('Rotation must be 0, 90, 180, or 270 degrees');
     }
 
@@ -85,14 +90,18 @@ export class PlantInstance {
    * Verifica si esta planta se solapa con otra
    */
   overlaps(other: PlantInstance): boolean {
-    const box1 = this.getBoundingBox();
-    const box2 = other.getBoundingBox();
+    // Se leen los campos directamente: este método corre en el bucle de
+    // colisiones del AG y no debe crear bounding boxes por pareja
+    const x1 = this.position.x;
+    const y1 = this.position.y;
+    const x2 = other.position.x;
+    const y2 = other.position.y;
 
     return !(
-      box1.x + box1.width <= box2.x ||
-      box2.x + box2.width <= box1.x ||
-      box1.y + box1.height <= box2.y ||
-      box2.y + box2.height <= box1.y
+      x1 + this.width <= x2 ||
+      x2 + other.width <= x1 ||
+      y1 + this.height <= y2 ||
+      y2 + other.height <= y1
     );
   }
 
@@ -6,7 +6,7 @@ export interface CompatibilityEntry {
 
 export interface CompatibilityMatrixRepository {
   getCompatibility(plant1: string, plant2: string): Promise<number>;
-  getAllCompatibilities(): Promise<Map<string, Map<string, number>>>;
+  getAllCompatibilities(): Promise<ReadonlyMap<string, ReadonlyMap<string, number>>>;
   count(): Promise<number>;
   createMany(entries: CompatibilityEntry[]): Promise<void>;
 }
@@ -9,6 +9,21 @@ export interface Location {
 export type Season = 'spring' | 'summer' | 'autumn' | 'winter';
 export type Hemisphere = 'north' | 'south';
 
+/**
+ * Notas base de siembra por estación
+ */
+const SEASONAL_NOTES: Record<Season, string> = {
+  spring: 'Temporada ideal para siembra. Mantener humedad constante.',
+  summer: 'Aumentar frecuencia de riego. Proteger del sol directo intenso.',
+  autumn: 'Reducir riego gradualmente. Preparar para temporada fría.',
+  winter: 'Proteger de heladas. Riego moderado.',
+};
+
+/**
+ * Especies aromáticas que requieren poda regular
+ */
+const AROMATIC_SPECIES: ReadonlySet<string> = new Set(['Cilantro', 'Albahaca', 'Hierbabuena', 'Orégano']);
+
 /**
  * Servicio para generar calendarios de siembra y mantenimiento.
  */
@@ -98,18 +113,10 @@ export class CalendarGeneratorService {
    * Genera notas de plantación específicas.
    */
   private generatePlantingNotes(species: string, season: Season): string {
-    const seasonalNotes: Record<Season, string> = {
-      spring: 'Temporada ideal para siembra. Mantener humedad constante.',
-      summer: 'Aumentar frecuencia de riego. Proteger del sol directo intenso.',
-      autumn: 'Reducir riego gradualmente. Preparar para temporada fría.',
-      winter: 'Proteger de heladas. Riego moderado.',
-    };
-
-    const baseNote = seasonalNotes[season];
+    const baseNote = SEASONAL_NOTES[season];
 
     // Notas específicas por tipo de planta
-    const aromatic = ['Cilantro', 'Albahaca', 'Hierbabuena', 'Orégano'];
-    if (aromatic.includes(species)) {
+    if (AROMATIC_SPECIES.has(species)) {
       return `${baseNote} Podar regularmente para promover crecimiento.`;
     }
 
@@ -1,9 +1,20 @@
 import { Individual } from '../entities/Individual';
+import { PlantCategory } from '../entities/Plant';
 import { Metrics } from '../value-objects/Metrics';
 import { CategoryDistribution } from '../value-objects/CategoryDistribution';
+import { CompatibilityTable, COMPATIBILITY_SCALE } from '../value-objects/CompatibilityTable';
 
 export type Objective = 'alimenticio' | 'medicinal' | 'sostenible' | 'ornamental';
 
+export type ObjectiveWeights = {
+  CEE: number;
+  PSRNT: number;
+  EH: number;
+  UE: number;
+  CS: number;
+  BSN: number;
+};
+
 /**
  * Pesos dinámicos MEJORADOS según objetivo del huerto.
  *
@@ -15,18 +26,113 @@ export type Objective = 'alimenticio' | 'medicinal' | 'sostenible' | 'ornamental
  * - CS: Ciclos Sincronizados (NUEVO)
  * - BSN: Balance de Suelo y Nutrientes (NUEVO)
  */
-const OBJECTIVE_WEIGHTS: Record<
-  Objective,
-  { CEE: number; PSRNT: number; EH: number; UE: number; CS: number; BSN: number }
-> = {
+const OBJECTIVE_WEIGHTS: Readonly<Record<Objective, Readonly<ObjectiveWeights>>> = {
   alimenticio: { CEE: 0.15, PSRNT: 0.40, EH: 0.15, UE: 0.10, CS: 0.10, BSN: 0.10 },
   medicinal: { CEE: 0.20, PSRNT: 0.35, EH: 0.10, UE: 0.10, CS: 0.10, BSN: 0.15 },
   sostenible: { CEE: 0.20, PSRNT: 0.15, EH: 0.30, UE: 0.10, CS: 0.10, BSN: 0.15 },
   ornamental: { CEE: 0.15, PSRNT: 0.30, EH: 0.10, UE: 0.20, CS: 0.10, BSN: 0.15 },
 };
 
+/**
+ * Umbrales de incompatibilidad (-0.5) y sinergia (0.5) en la escala
+ * entera de la tabla de compatibilidad.
+ */
+const NEGATIVE_THRESHOLD = -0.5 * COMPATIBILITY_SCALE;
+const POSITIVE_THRESHOLD = 0.5 * COMPATIBILITY_SCALE;
+
+/**
+ * Kernel de CEE sobre arreglos planos.
+ *
+ * Recorre todas las parejas (i, j) con i < j, pondera la compatibilidad
+ * por exp(-distancia / 2) y devuelve el promedio normalizado a [0, 1].
+ * Los scores se usan en su escala entera (centésimas): los umbrales se
+ * comparan en enteros y la escala se quita una sola vez al final.
+ * `compat` es una matriz densa cuantizada (× COMPATIBILITY_SCALE) indexada
+ * por `species[i] * stride + species[j]`.
+ */
+function weightedCompatibility(
+  xs: Float64Array,
+  ys: Float64Array,
+  species: Int32Array,
+  compat: Int8Array,
+  stride: number
+): number {
+  const n = xs.length;
+  let totalScore = 0;
+  let totalWeight = 0;
+
+  for (let i = 0; i < n; i++) {
+    const xi = xs[i];
+    const yi = ys[i];
+    const row = species[i] * stride;
+
+    for (let j = i + 1; j < n; j++) {
+      const dx = xi - xs[j];
+      const dy = yi - ys[j];
+      const distance = Math.sqrt(dx * dx + dy * dy);
+
+      // Peso exponencial inverso: plantas cercanas tienen mucho más impacto
+      const weight = Math.exp(-distance / 2);
+
+      const compatibility = compat[row + species[j]];
+
+      // Penalización severa por incompatibilidad cercana
+      if (compatibility < NEGATIVE_THRESHOLD && distance < 1.5) {
+        totalScore += compatibility * weight * 2; // Doble penalización
+      } else if (compatibility > POSITIVE_THRESHOLD && distance < 1.0) {
+        totalScore += compatibility * weight * 1.5; // Bonificación por sinergia cercana
+      } else {
+        totalScore += compatibility * weight;
+      }
+
+      totalWeight += weight;
+    }
+  }
+
+  if (totalWeight === 0) {
+    return 1.0;
+  }
+
+  // Normalizar de [-1, 1] a [0, 1]
+  const averageScore = totalScore / (totalWeight * COMPATIBILITY_SCALE);
+  return Math.max(0, Math.min(1, (averageScore + 1) / 2));
+}
+
+/**
+ * Máxima entropía con 4 categorías.
+ */
+const MAX_CATEGORY_ENTROPY = Math.log2(4);
+
+/**
+ * Aporte de una categoría (en porcentaje) a la entropía de Shannon.
+ * Las categorías vacías no aportan.
+ */
+function entropyTerm(percentage: number): number {
+  if (percentage <= 0) {
+    return 0;
+  }
+  const p = percentage / 100;
+  return -p * Math.log2(p);
+}
+
+/**
+ * Datos de un individuo reunidos en un solo recorrido para evaluar todas
+ * las métricas sin volver a iterar sus plantas.
+ */
+interface IndividualSummary {
+  xs: Float64Array;
+  ys: Float64Array;
+  speciesOf: Int32Array;
+  usedArea: number;
+  weeklyWater: number;
+  vegetable: number;
+  medicinal: number;
+  aromatic: number;
+  ornamental: number;
+}
+
 export interface FitnessConfig {
-  compatibilityMatrix: Map<string, Map<string, number>>;
+  compatibilityMatrix: ReadonlyMap<string, ReadonlyMap<string, number>>;
   objective: Objective;
   desiredCategoryDistribution?: CategoryDistribution;
   maxWaterWeekly: number;
@@ -34,24 +140,121 @@ export interface FitnessConfig {
 }
 
 export class FitnessCalculator {
-  constructor(private config: FitnessConfig) {}
+  /**
+   * Matriz de compatibilidad densa indexada por especie.
+   * Se comparte entre instancias creadas sobre la misma matriz.
+   */
+  private readonly compatibility: CompatibilityTable;
+
+  /**
+   * Pesos del objetivo, resueltos una vez por instancia.
+   */
+  private readonly weights: Readonly<ObjectiveWeights>;
+
+  /**
+   * Buffers de trabajo de summarize(), reutilizados entre evaluaciones.
+   * Solo crecen; cada resumen usa una vista de los primeros n elementos,
+   * válida hasta la siguiente evaluación.
+   */
+  private xsBuffer = new Float64Array(0);
+  private ysBuffer = new Float64Array(0);
+  private speciesBuffer = new Int32Array(0);
+
+  constructor(private config: FitnessConfig) {
+    this.compatibility = CompatibilityTable.for(config.compatibilityMatrix);
+    this.weights = OBJECTIVE_WEIGHTS[config.objective];
+  }
 
   /**
    * Calcula el fitness completo de un individuo.
    * Evalúa 6 métricas: CEE, PSRNT, EH, UE, CS, BSN.
    */
   calculate(individual: Individual): Metrics {
-    const CEE = this.calculateCEE(individual);
-    const PSRNT = this.calculatePSRNT(individual);
-    const EH = this.calculateEH(individual);
-    const UE = this.calculateUE(individual);
     // Nota: CS y BSN se calculan pero no se usan por compatibilidad con Metrics original
     // const CS = this._calculateCS(individual);
     // const BSN = this._calculateBSN(individual);
+    return this.evaluate(individual);
+  }
 
-    const weights = OBJECTIVE_WEIGHTS[this.config.objective];
+  /**
+   * Evalúa una población completa en una sola llamada y asigna las
+   * métricas a cada individuo.
+   */
+  evaluatePopulation(population: Individual[]): void {
+    for (const individual of population) {
+      individual.metrics = this.evaluate(individual);
+    }
+  }
+
+  /**
+   * Evalúa las métricas activas a partir de un único recorrido del individuo.
+   */
+  private evaluate(individual: Individual): Metrics {
+    const summary = this.summarize(individual);
+
+    return new Metrics(
+      {
+        CEE: this.calculateCEE(summary),
+        PSRNT: this.calculatePSRNT(summary),
+        EH: this.calculateEH(summary),
+        UE: this.calculateUE(summary, individual.dimensions.totalArea),
+      },
+      this.weights
+    );
+  }
+
+  /**
+   * Recorre las plantas una sola vez y reúne todo lo que necesitan las
+   * métricas: posiciones e índices de especie para CEE, agua para EH,
+   * área para UE y conteo por categoría para PSRNT.
+   */
+  private summarize(individual: Individual): IndividualSummary {
+    const plants = individual.plants;
+    const n = plants.length;
+
+    if (this.xsBuffer.length < n) {
+      this.xsBuffer = new Float64Array(n);
+      this.ysBuffer = new Float64Array(n);
+      this.speciesBuffer = new Int32Array(n);
+    }
+    const xs = this.xsBuffer.subarray(0, n);
+    const ys = this.ysBuffer.subarray(0, n);
+    const speciesOf = this.speciesBuffer.subarray(0, n);
+    let usedArea = 0;
+    let weeklyWater = 0;
+    let vegetable = 0;
+    let medicinal = 0;
+    let aromatic = 0;
+    let ornamental = 0;
+
+    for (let i = 0; i < n; i++) {
+      const plantInstance = plants[i];
+      const plant = plantInstance.plant;
+
+      xs[i] = plantInstance.position.x;
+      ys[i] = plantInstance.position.y;
+      speciesOf[i] = this.compatibility.indexOf(plant.species);
+      usedArea += plantInstance.totalArea;
+      weeklyWater += plantInstance.totalWeeklyWater;
+
+      const mask = plant.categoryMask;
+      if (mask & PlantCategory.vegetable) vegetable++;
+      if (mask & PlantCategory.medicinal) medicinal++;
+      if (mask & PlantCategory.aromatic) aromatic++;
+      if (mask & PlantCategory.ornamental) ornamental++;
+    }
 
-    return new Metrics({ CEE, PSRNT, EH, UE }, weights);
+    return {
+      xs,
+      ys,
+      speciesOf,
+      usedArea,
+      weeklyWater,
+      vegetable,
+      medicinal,
+      aromatic,
+      ornamental,
+    };
   }
 
   /**
@@ -62,49 +265,18 @@ export class FitnessCalculator {
    * 2. Bonificación por parejas beneficiosas adyacentes
    * 3. Peso basado en distancia euclidiana real
    */
-  private calculateCEE(individual: Individual): number {
-    if (individual.plants.length < 2) {
-      return 1.0;
-    }
-
-    let totalScore = 0;
-    let totalWeight = 0;
-
-    for (let i = 0; i < individual.plants.length; i++) {
-      for (let j = i + 1; j < individual.plants.length; j++) {
-        const plant1 = individual.plants[i];
-        const plant2 = individual.plants[j];
-
-        const distance = plant1.position.distanceTo(plant2.position);
-
-        // Peso exponencial inverso: plantas cercanas tienen mucho más impacto
-        const weight = Math.exp(-distance / 2);
-
-        const compatibility = this.getCompatibilityScore(
-          plant1.plant.species,
-          plant2.plant.species
-        );
-
-        // Penalización severa por incompatibilidad cercana
-        if (compatibility < -0.5 && distance < 1.5) {
-          totalScore += compatibility * weight * 2; // Doble penalización
-        } else if (compatibility > 0.5 && distance < 1.0) {
-          totalScore += compatibility * weight * 1.5; // Bonificación por sinergia cercana
-        } else {
-          totalScore += compatibility * weight;
-        }
-
-        totalWeight += weight;
-      }
-    }
-
-    if (totalWeight === 0) {
+  private calculateCEE(summary: IndividualSummary): number {
+    if (summary.xs.length < 2) {
       return 1.0;
     }
 
-    // Normalizar de [-1, 1] a [0, 1]
-    const averageScore = totalScore / totalWeight;
-    return Math.max(0, Math.min(1, (averageScore + 1) / 2));
+    return weightedCompatibility(
+      summary.xs,
+      summary.ys,
+      summary.speciesOf,
+      this.compatibility.scores,
+      this.compatibility.stride
+    );
   }
 
   /**
@@ -114,24 +286,27 @@ export class FitnessCalculator {
    * 1. Penalización cuadrática por desviación
    * 2. Bonificación por diversidad balanceada
    */
-  private calculatePSRNT(individual: Individual): number {
+  private calculatePSRNT(summary: IndividualSummary): number {
     if (!this.config.desiredCategoryDistribution) {
       // Sin distribución deseada: premiar diversidad
-      return this.calculateDiversityBonus(individual);
+      return this.calculateDiversityBonus(summary);
     }
 
-    const actual = this.calculateCategoryDistribution(individual);
+    const actual = this.calculateCategoryDistribution(summary);
     const desired = this.config.desiredCategoryDistribution;
 
-    // Error cuadrático medio
-    const errors = [
-      Math.pow(actual.vegetable - desired.vegetable, 2),
-      Math.pow(actual.medicinal - desired.medicinal, 2),
-      Math.pow(actual.aromatic - desired.aromatic, 2),
-      Math.pow(actual.ornamental - desired.ornamental, 2),
-    ];
+    // Error cuadrático medio, acumulado en escalares
+    const dVegetable = actual.vegetable - desired.vegetable;
+    const dMedicinal = actual.medicinal - desired.medicinal;
+    const dAromatic = actual.aromatic - desired.aromatic;
+    const dOrnamental = actual.ornamental - desired.ornamental;
 
-    const mse = errors.reduce((sum, e) => sum + e, 0) / 4;
+    const mse =
+      (dVegetable * dVegetable +
+        dMedicinal * dMedicinal +
+        dAromatic * dAromatic +
+        dOrnamental * dOrnamental) /
+      4;
 
     // Convertir error a satisfacción [0, 1]
     return Math.max(0, 1 - Math.sqrt(mse) / 100);
@@ -144,8 +319,8 @@ export class FitnessCalculator {
    * 1. Curva de eficiencia realista (óptimo 80-95%)
    * 2. Penalización progresiva por exceso
    */
-  private calculateEH(individual: Individual): number {
-    const waterUsed = individual.totalWeeklyWater;
+  private calculateEH(summary: IndividualSummary): number {
+    const waterUsed = summary.weeklyWater;
     const waterMax = this.config.maxWaterWeekly;
 
     if (waterMax === 0) {
@@ -154,10 +329,11 @@ export class FitnessCalculator {
 
     const usage = waterUsed / waterMax;
 
-    // Penalización severa por exceso
+    // Penalización severa por exceso: parte de 0.9 (valor en usage = 1.0)
+    // para que superar el límite nunca puntúe mejor que respetarlo
     if (usage > 1.0) {
       const excess = usage - 1.0;
-      return Math.max(0, 1 - excess * 2);
+      return Math.max(0, 0.9 - excess * 2);
     }
 
     // Curva de eficiencia óptima: 80-95%
@@ -178,9 +354,8 @@ export class FitnessCalculator {
    * 1. Óptimo realista: 70-85%
    * 2. Penalización por sobresaturación
    */
-  private calculateUE(individual: Individual): number {
-    const usedArea = individual.usedArea;
-    const totalArea = individual.dimensions.totalArea;
+  private calculateUE(summary: IndividualSummary, totalArea: number): number {
+    const usedArea = summary.usedArea;
 
     if (totalArea === 0) {
       return 0;
@@ -254,73 +429,43 @@ export class FitnessCalculator {
   /**
    * Bonificación por diversidad balanceada
    */
-  private calculateDiversityBonus(individual: Individual): number {
-    const dist = this.calculateCategoryDistribution(individual);
-    const values = [dist.vegetable, dist.medicinal, dist.aromatic, dist.ornamental];
+  private calculateDiversityBonus(summary: IndividualSummary): number {
+    const dist = this.calculateCategoryDistribution(summary);
 
     // Calcular entropía de Shannon normalizada
-    const entropy = values
-      .filter(v => v > 0)
-      .reduce((sum, v) => {
-        const p = v / 100;
-        return sum - p * Math.log2(p);
-      }, 0);
-
-    const maxEntropy = Math.log2(4); // Máxima entropía con 4 categorías
-    return entropy / maxEntropy;
-  }
-
-  /**
-   * Obtiene el score de compatibilidad entre dos plantas.
-   */
-  private getCompatibilityScore(species1: string, species2: string): number {
-    const score1 = this.config.compatibilityMatrix.get(species1)?.get(species2);
-    if (score1 !== undefined) {
-      return score1;
-    }
+    const entropy =
+      entropyTerm(dist.vegetable) +
+      entropyTerm(dist.medicinal) +
+      entropyTerm(dist.aromatic) +
+      entropyTerm(dist.ornamental);
 
-    const score2 = this.config.compatibilityMatrix.get(species2)?.get(species1);
-    if (score2 !== undefined) {
-      return score2;
-    }
-
-    return 0; // Neutral
+    return entropy / MAX_CATEGORY_ENTROPY;
   }
 
   /**
-   * Calcula la distribución de categorías del individuo.
+   * Calcula la distribución de categorías a partir del conteo del resumen.
    */
-  private calculateCategoryDistribution(individual: Individual): CategoryDistribution {
-    const counts = {
-      vegetable: 0,
-      medicinal: 0,
-      aromatic: 0,
-      ornamental: 0,
-    };
-
-    individual.plants.forEach(plantInstance => {
-      plantInstance.plant.type.forEach(type => {
-        if (type in counts) {
-          (counts as any)[type] += 1; // Cada instancia = 1 planta
-        }
-      });
-    });
-
-    const total = Object.values(counts).reduce((sum, count) => sum + count, 0);
+  private calculateCategoryDistribution(summary: IndividualSummary): CategoryDistribution {
+    const { vegetable, medicinal, aromatic, ornamental } = summary;
+    const total = vegetable + medicinal + aromatic + ornamental;
 
     if (total === 0) {
       return new CategoryDistribution({ vegetable: 25, medicinal: 25, aromatic: 25, ornamental: 25 });
     }
 
     return new CategoryDistribution({
-      vegetable: (counts.vegetable / total) * 100,
-      medicinal: (counts.medicinal / total) * 100,
-      aromatic: (counts.aromatic / total) * 100,
-      ornamental: (counts.ornamental / total) * 100,
+      vegetable: (vegetable / total) * 100,
+      medicinal: (medicinal / total) * 100,
+      aromatic: (aromatic / total) * 100,
+      ornamental: (ornamental / total) * 100,
     });
   }
 
-  getWeights() {
-    return OBJECTIVE_WEIGHTS[this.config.objective];
+  /**
+   * Copia de los pesos aplicados: la tabla de pesos es compartida entre
+   * instancias y no debe quedar expuesta a mutaciones externas.
+   */
+  getWeights(): ObjectiveWeights {
+    return { ...this.weights };
   }
 }
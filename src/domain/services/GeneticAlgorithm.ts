@@ -48,6 +48,27 @@ export interface GAResult {
   selectedPlants: Plant[]; // NUEVO: plantas seleccionadas para el pool
 }
 
+/**
+ * Devuelve el control al event loop (una vuelta de setImmediate).
+ */
+function yieldToEventLoop(): Promise<void> {
+  return new Promise(resolve => setImmediate(resolve));
+}
+
+/**
+ * Comparador para ordenar de mayor a menor fitness.
+ */
+function byFitnessDesc(a: Individual, b: Individual): number {
+  return b.fitness - a.fitness;
+}
+
+/**
+ * Indica si el individuo aún no tiene métricas (nuevo o mutado).
+ */
+function needsEvaluation(individual: Individual): boolean {
+  return individual.metrics === undefined;
+}
+
 /**
  * Algoritmo Genético MEJORADO para optimización de huertos.
  *
@@ -65,6 +86,8 @@ export class GeneticAlgorithm {
   private fitnessCalculator: FitnessCalculator;
   private rng: () => number;
   private generationStats: GAResult['generationStats'] = [];
+  private poolIndex: Map<Plant, number> = new Map(); // Planta del pool → índice
+  private spacingTable: Float64Array = new Float64Array(0); // Distancias requeridas k×k
 
   constructor(
     allPlants: Plant[],
@@ -76,7 +99,7 @@ export class GeneticAlgorithm {
     this.config = config;
 
     // Inicializar RNG
-    this.rng = config.seed !== undefined ? this.seededRandom(config.seed) : Math.random;
+    this.rng = this.createRng();
 
     this.selectedPlants = []; // Se inicializa en run()
   }
@@ -91,6 +114,12 @@ export class GeneticAlgorithm {
     const startTime = Date.now();
     let stoppingReason: GAResult['stoppingReason'] = 'max_generations';
 
+    // Estado nuevo por ejecución: no acumular entre llamadas a run()
+    // ni compartir el arreglo con el resultado de una ejecución anterior.
+    // El RNG con semilla también se reinicia para que cada run() sea reproducible
+    this.generationStats = [];
+    this.rng = this.createRng();
+
     logger.info('Iniciando Algoritmo Genético MEJORADO', {
       population: this.config.populationSize,
       maxGenerations: this.config.maxGenerations,
@@ -100,6 +129,7 @@ export class GeneticAlgorithm {
 
     // FASE 0: Selección inteligente de plantas
     this.selectedPlants = this.selectPlantsIntelligently(constraints, objective);
+    this.buildSpacingTable();
 
     logger.info(`Plantas seleccionadas: ${this.selectedPlants.length}`, {
       species: this.selectedPlants.map(p => p.species),
@@ -109,11 +139,9 @@ export class GeneticAlgorithm {
     let population = this.initializePopulationHeuristic(constraints);
 
     // Evaluar población inicial
-    population.forEach(ind => {
-      ind.metrics = this.fitnessCalculator.calculate(ind);
-    });
+    this.fitnessCalculator.evaluatePopulation(population);
 
-    let bestFitness = Math.max(...population.map(ind => ind.fitness));
+    let bestFitness = this.bestFitnessOf(population);
     let generationsWithoutImprovement = 0;
 
     // CICLO EVOLUTIVO
@@ -125,6 +153,12 @@ export class GeneticAlgorithm {
         break;
       }
 
+      // Ceder el event loop entre generaciones: la evaluación es CPU pura y,
+      // sin esta pausa, una ejecución larga bloquea las demás peticiones HTTP
+      if (generation > 0) {
+        await yieldToEventLoop();
+      }
+
       // FASE 2: Selección por Torneo
       const selected = this.tournamentSelection(population);
 
@@ -143,38 +177,20 @@ export class GeneticAlgorithm {
       }
 
       // FASE 4: Mutación múltiple
-      offspring.forEach(ind => {
-        // Mutación por intercambio de posiciones
-        if (this.rng() < this.config.mutationRate) {
-          this.swapMutation(ind);
-        }
-
-        // Mutación por inserción de nueva planta
-        if (this.rng() < this.config.insertionRate) {
-          this.insertMutation(ind, constraints);
-        }
-
-        // Mutación por eliminación de planta
-        if (this.rng() < this.config.deletionRate) {
-          this.deleteMutation(ind);
-        }
-
-        // Mutación de posición (mover planta existente)
-        if (this.rng() < this.config.mutationRate * 0.5) {
-          this.positionMutation(ind);
-        }
-      });
+      for (const ind of offspring) {
+        this.mutate(ind, constraints);
+      }
 
       // FASE 5: Evaluación
-      offspring.forEach(ind => {
-        ind.metrics = this.fitnessCalculator.calculate(ind);
-      });
+      // Los clones que no cambiaron conservan sus métricas; solo se evalúan
+      // los hijos nuevos o modificados por alguna mutación
+      this.fitnessCalculator.evaluatePopulation(offspring.filter(needsEvaluation));
 
       // FASE 6: Reemplazo Generacional con Elitismo
       population = this.elitistReplacement(population, offspring);
 
       // Verificar mejora
-      const currentBest = Math.max(...population.map(ind => ind.fitness));
+      const currentBest = this.bestFitnessOf(population);
       const improvement = currentBest - bestFitness;
 
       if (improvement > 0.001) {
@@ -186,10 +202,16 @@ export class GeneticAlgorithm {
 
       // Guardar estadísticas
       if (generation % 10 === 0 || generation === this.config.maxGenerations - 1) {
-        const avgFitness = population.reduce((sum, ind) => sum + ind.fitness, 0) / population.length;
+        // Promedios acumulados en una sola pasada
+        let fitnessSum = 0;
+        let plantsSum = 0;
+        for (const ind of population) {
+          fitnessSum += ind.fitness;
+          plantsSum += ind.plants.length;
+        }
+        const avgFitness = fitnessSum / population.length;
+        const avgSpeciesCount = plantsSum / population.length;
         const diversity = this.calculateDiversity(population);
-        const avgSpeciesCount =
-          population.reduce((sum, ind) => sum + ind.plants.length, 0) / population.length;
 
         this.generationStats.push({
           generation,
@@ -199,12 +221,15 @@ export class GeneticAlgorithm {
           avgSpeciesCount,
         });
 
-        logger.debug(`Generación ${generation}`, {
-          bestFitness: currentBest.toFixed(4),
-          avgFitness: avgFitness.toFixed(4),
-          diversity: diversity.toFixed(4),
-          avgSpecies: avgSpeciesCount.toFixed(1),
-        });
+        // Solo formatear el detalle si el nivel debug está activo
+        if (logger.isDebugEnabled()) {
+          logger.debug(`Generación ${generation}`, {
+            bestFitness: currentBest.toFixed(4),
+            avgFitness: avgFitness.toFixed(4),
+            diversity: diversity.toFixed(4),
+            avgSpecies: avgSpeciesCount.toFixed(1),
+          });
+        }
       }
 
       // FASE 7: Criterios de parada
@@ -214,7 +239,7 @@ export class GeneticAlgorithm {
         break;
       }
 
-      const fitnessVariance = this.calculateVariance(population.map(ind => ind.fitness));
+      const fitnessVariance = this.calculateVariance(population);
       if (fitnessVariance < this.config.convergenceThreshold) {
         logger.info(`Convergencia: varianza < ${this.config.convergenceThreshold}`);
         stoppingReason = 'convergence';
@@ -223,7 +248,7 @@ export class GeneticAlgorithm {
     }
 
     // Ordenar y retornar top 3
-    population.sort((a, b) => b.fitness - a.fitness);
+    population.sort(byFitnessDesc);
     const topSolutions = population.slice(0, 3);
 
     const executionTime = Date.now() - startTime;
@@ -315,10 +340,18 @@ export class GeneticAlgorithm {
     let usedWater = 0;
     let usedBudget = 0;
 
+    // Límites de recursos: invariantes durante toda la construcción
+    const areaLimit = constraints.maxArea * 0.85;
+    const waterLimit = constraints.maxWaterWeekly;
+    const budgetLimit = constraints.maxBudget;
+
     // Estrategia: Distribuir en grid con espaciamiento inteligente
     // Cada especie puede tener 1-3 plantas individuales
     for (const plant of chosenPlants) {
       const plantsOfThisSpecies = 1 + Math.floor(this.rng() * 2); // 1-2 plantas por especie
+      const margin = plant.sideLength; // Margen basado en tamaño de planta
+      const spanX = width - 2 * margin;
+      const spanY = height - 2 * margin;
 
       for (let i = 0; i < plantsOfThisSpecies; i++) {
         // Intentar encontrar una posición válida
@@ -327,9 +360,8 @@ export class GeneticAlgorithm {
 
         while (attempts < 50 && !validPosition) {
           // Generar posición aleatoria con margen
-          const margin = Math.sqrt(plant.size); // Margen basado en tamaño de planta
-          const x = margin + this.rng() * (width - 2 * margin);
-          const y = margin + this.rng() * (height - 2 * margin);
+          const x = margin + this.rng() * spanX;
+          const y = margin + this.rng() * spanY;
           const position = new Position(x, y);
 
           // Crear instancia temporal para validar
@@ -339,10 +371,7 @@ export class GeneticAlgorithm {
           });
 
           // Verificar que no haya colisiones
-          const hasCollision = plantInstances.some(existing => {
-            return tempInstance.overlaps(existing) ||
-                   !this.hasAdequateSpacing(tempInstance, existing);
-          });
+          const hasCollision = this.collidesWithAny(tempInstance, plantInstances);
 
           // Verificar que esté dentro de los límites
           const withinBounds =
@@ -356,9 +385,9 @@ export class GeneticAlgorithm {
           const plantCost = tempInstance.totalCost;
 
           const withinConstraints =
-            usedArea + plantArea <= constraints.maxArea * 0.85 &&
-            usedWater + plantWater <= constraints.maxWaterWeekly &&
-            (!constraints.maxBudget || usedBudget + plantCost <= constraints.maxBudget);
+            usedArea + plantArea <= areaLimit &&
+            usedWater + plantWater <= waterLimit &&
+            (!budgetLimit || usedBudget + plantCost <= budgetLimit);
 
           if (!hasCollision && withinBounds && withinConstraints) {
             plantInstances.push(tempInstance);
@@ -377,11 +406,48 @@ export class GeneticAlgorithm {
   }
 
   /**
-   * Verifica que dos plantas tengan espaciamiento adecuado según compatibilidad
+   * Verifica si `candidate` se solapa o queda demasiado cerca de alguna
+   * planta de `plants`. `skipIndex` excluye una posición (la planta que se
+   * está moviendo) sin copiar el arreglo.
    */
-  private hasAdequateSpacing(plant1: PlantInstance, plant2: PlantInstance): boolean {
-    const distance = plant1.distanceTo(plant2);
-    const compatibility = this.getCompatibilityScore(plant1.plant.species, plant2.plant.species);
+  private collidesWithAny(
+    candidate: PlantInstance,
+    plants: PlantInstance[],
+    skipIndex: number = -1
+  ): boolean {
+    // Datos del candidato y de la tabla resueltos una sola vez por llamada
+    const candidatePlant = candidate.plant;
+    const row = this.poolIndex.get(candidatePlant);
+    const poolSize = this.selectedPlants.length;
+    const spacingTable = this.spacingTable;
+
+    for (let i = 0; i < plants.length; i++) {
+      if (i === skipIndex) continue;
+      const existing = plants[i];
+      if (candidate.overlaps(existing)) {
+        return true;
+      }
+
+      // Plantas del pool: distancia requerida precalculada para esta ejecución
+      const j = this.poolIndex.get(existing.plant);
+      const required =
+        row !== undefined && j !== undefined
+          ? spacingTable[row * poolSize + j]
+          : this.requiredSpacing(candidatePlant, existing.plant);
+
+      if (candidate.distanceTo(existing) < required) {
+        return true;
+      }
+    }
+    return false;
+  }
+
+  /**
+   * Distancia mínima entre centros de dos plantas según su compatibilidad
+   * y tamaño.
+   */
+  private requiredSpacing(plant1: Plant, plant2: Plant): number {
+    const compatibility = this.getCompatibilityScore(plant1.species, plant2.species);
 
     // Distancia mínima según compatibilidad
     let minDistance: number;
@@ -394,10 +460,30 @@ export class GeneticAlgorithm {
     }
 
     // Agregar radios de las plantas
-    const radius1 = Math.sqrt(plant1.plant.size) / 2;
-    const radius2 = Math.sqrt(plant2.plant.size) / 2;
+    const radius1 = plant1.sideLength / 2;
+    const radius2 = plant2.sideLength / 2;
 
-    return distance >= minDistance + radius1 + radius2;
+    return minDistance + radius1 + radius2;
+  }
+
+  /**
+   * Especializa la validación de espaciamiento al pool de esta ejecución:
+   * el pool es pequeño (maxSpecies) y fijo durante todo el run, así que la
+   * distancia requerida de cada pareja se calcula una sola vez.
+   */
+  private buildSpacingTable(): void {
+    const pool = this.selectedPlants;
+    const k = pool.length;
+
+    this.poolIndex = new Map();
+    pool.forEach((plant, i) => this.poolIndex.set(plant, i));
+
+    this.spacingTable = new Float64Array(k * k);
+    for (let i = 0; i < k; i++) {
+      for (let j = 0; j < k; j++) {
+        this.spacingTable[i * k + j] = this.requiredSpacing(pool[i], pool[j]);
+      }
+    }
   }
 
   /**
@@ -417,17 +503,16 @@ export class GeneticAlgorithm {
     const selected: Individual[] = [];
 
     for (let i = 0; i < this.config.populationSize; i++) {
-      const tournament: Individual[] = [];
+      // El ganador se lleva en línea: no se construye un arreglo por torneo
+      let winner = population[Math.floor(this.rng() * population.length)];
 
-      for (let j = 0; j < this.config.tournamentK; j++) {
-        const randomIndex = Math.floor(this.rng() * population.length);
-        tournament.push(population[randomIndex]);
+      for (let j = 1; j < this.config.tournamentK; j++) {
+        const current = population[Math.floor(this.rng() * population.length)];
+        if (current.fitness > winner.fitness) {
+          winner = current;
+        }
       }
 
-      const winner = tournament.reduce((best, current) =>
-        current.fitness > best.fitness ? current : best
-      );
-
       selected.push(winner);
     }
 
@@ -465,6 +550,31 @@ export class GeneticAlgorithm {
     return [child1, child2];
   }
 
+  /**
+   * FASE 4: Aplica las mutaciones a un hijo según sus probabilidades.
+   */
+  private mutate(individual: Individual, constraints: GAConstraints): void {
+    // Mutación por intercambio de posiciones
+    if (this.rng() < this.config.mutationRate) {
+      this.swapMutation(individual);
+    }
+
+    // Mutación por inserción de nueva planta
+    if (this.rng() < this.config.insertionRate) {
+      this.insertMutation(individual, constraints);
+    }
+
+    // Mutación por eliminación de planta
+    if (this.rng() < this.config.deletionRate) {
+      this.deleteMutation(individual);
+    }
+
+    // Mutación de posición (mover planta existente)
+    if (this.rng() < this.config.mutationRate * 0.5) {
+      this.positionMutation(individual);
+    }
+  }
+
   /**
    * FASE 4: Mutación por intercambio.
    */
@@ -482,6 +592,8 @@ export class GeneticAlgorithm {
       individual.plants[idx2],
       individual.plants[idx1],
     ];
+    // Invertir el orden cambia la orientación de las parejas en CEE
+    individual.metrics = undefined;
   }
 
   /**
@@ -496,12 +608,19 @@ export class GeneticAlgorithm {
     // Seleccionar planta aleatoria del pool
     const newPlant = this.selectedPlants[Math.floor(this.rng() * this.selectedPlants.length)];
 
+    // Recursos ya usados: no cambian entre intentos, se calculan una sola vez
+    const usedArea = individual.usedArea;
+    const usedWater = individual.totalWeeklyWater;
+    const margin = newPlant.sideLength;
+    const { width, height } = individual.dimensions;
+    const areaLimit = constraints.maxArea * 0.85;
+    const waterLimit = constraints.maxWaterWeekly;
+
     // Intentar encontrar posición válida
     let attempts = 0;
     while (attempts < 30) {
-      const margin = Math.sqrt(newPlant.size);
-      const x = margin + this.rng() * (individual.dimensions.width - 2 * margin);
-      const y = margin + this.rng() * (individual.dimensions.height - 2 * margin);
+      const x = margin + this.rng() * (width - 2 * margin);
+      const y = margin + this.rng() * (height - 2 * margin);
       const position = new Position(x, y);
 
       const instance = new PlantInstance({
@@ -510,26 +629,23 @@ export class GeneticAlgorithm {
       });
 
       // Verificar colisiones y espaciamiento
-      const hasCollision = individual.plants.some(existing => {
-        return instance.overlaps(existing) || !this.hasAdequateSpacing(instance, existing);
-      });
+      const hasCollision = this.collidesWithAny(instance, individual.plants);
 
       // Verificar límites
-      const withinBounds =
-        x + instance.width <= individual.dimensions.width &&
-        y + instance.height <= individual.dimensions.height;
+      const withinBounds = x + instance.width <= width && y + instance.height <= height;
 
       // Verificar restricciones de recursos
-      const newUsedArea = individual.usedArea + instance.totalArea;
-      const newWater = individual.totalWeeklyWater + instance.totalWeeklyWater;
+      const newUsedArea = usedArea + instance.totalArea;
+      const newWater = usedWater + instance.totalWeeklyWater;
 
       if (
         !hasCollision &&
         withinBounds &&
-        newUsedArea <= constraints.maxArea * 0.85 &&
-        newWater <= constraints.maxWaterWeekly
+        newUsedArea <= areaLimit &&
+        newWater <= waterLimit
       ) {
         individual.plants.push(instance);
+        individual.metrics = undefined; // El layout cambió: reevaluar
         return; // Éxito
       }
 
@@ -548,6 +664,7 @@ export class GeneticAlgorithm {
 
     const idx = Math.floor(this.rng() * individual.plants.length);
     individual.plants.splice(idx, 1);
+    individual.metrics = undefined; // El layout cambió: reevaluar
   }
 
   /**
@@ -561,12 +678,15 @@ export class GeneticAlgorithm {
     const idx = Math.floor(this.rng() * individual.plants.length);
     const plantToMove = individual.plants[idx];
 
+    // Invariantes del bucle de intentos
+    const margin = plantToMove.plant.sideLength;
+    const { width, height } = individual.dimensions;
+
     // Intentar encontrar nueva posición válida
     let attempts = 0;
     while (attempts < 20) {
-      const margin = Math.sqrt(plantToMove.plant.size);
-      const newX = margin + this.rng() * (individual.dimensions.width - 2 * margin);
-      const newY = margin + this.rng() * (individual.dimensions.height - 2 * margin);
+      const newX = margin + this.rng() * (width - 2 * margin);
+      const newY = margin + this.rng() * (height - 2 * margin);
       const newPosition = new Position(newX, newY);
 
       const movedPlant = new PlantInstance({
@@ -578,18 +698,14 @@ export class GeneticAlgorithm {
       });
 
       // Verificar colisiones con otras plantas (excluyendo la actual)
-      const otherPlants = individual.plants.filter((_, i) => i !== idx);
-      const hasCollision = otherPlants.some(existing => {
-        return movedPlant.overlaps(existing) || !this.hasAdequateSpacing(movedPlant, existing);
-      });
+      const hasCollision = this.collidesWithAny(movedPlant, individual.plants, idx);
 
       // Verificar límites
-      const withinBounds =
-        newX + movedPlant.width <= individual.dimensions.width &&
-        newY + movedPlant.height <= individual.dimensions.height;
+      const withinBounds = newX + movedPlant.width <= width && newY + movedPlant.height <= height;
 
       if (!hasCollision && withinBounds) {
         individual.plants[idx] = movedPlant;
+        individual.metrics = undefined; // El layout cambió: reevaluar
         return; // Éxito
       }
 
@@ -603,7 +719,7 @@ export class GeneticAlgorithm {
    */
   private elitistReplacement(parents: Individual[], offspring: Individual[]): Individual[] {
     const combined = [...parents, ...offspring];
-    combined.sort((a, b) => b.fitness - a.fitness);
+    combined.sort(byFitnessDesc);
     return combined.slice(0, this.config.populationSize);
   }
 
@@ -611,19 +727,38 @@ export class GeneticAlgorithm {
    * Calcula la diversidad de la población.
    */
   private calculateDiversity(population: Individual[]): number {
-    const fitnesses = population.map(ind => ind.fitness);
-    return this.calculateVariance(fitnesses);
+    return this.calculateVariance(population);
   }
 
   /**
-   * Calcula varianza.
+   * Calcula la varianza del fitness con acumuladores escalares,
+   * sin arreglos intermedios.
    */
-  private calculateVariance(values: number[]): number {
-    if (values.length === 0) return 0;
+  private calculateVariance(population: Individual[]): number {
+    const n = population.length;
+    if (n === 0) return 0;
+
+    let sum = 0;
+    for (const ind of population) sum += ind.fitness;
+    const mean = sum / n;
+
+    let squaredDiffs = 0;
+    for (const ind of population) {
+      const diff = ind.fitness - mean;
+      squaredDiffs += diff * diff;
+    }
+    return squaredDiffs / n;
+  }
 
-    const mean = values.reduce((sum, v) => sum + v, 0) / values.length;
-    const squaredDiffs = values.map(v => Math.pow(v - mean, 2));
-    return squaredDiffs.reduce((sum, d) => sum + d, 0) / values.length;
+  /**
+   * Mejor fitness de la población (sin copiar a un arreglo ni usar spread).
+   */
+  private bestFitnessOf(population: Individual[]): number {
+    let best = -Infinity;
+    for (const ind of population) {
+      if (ind.fitness > best) best = ind.fitness;
+    }
+    return best;
   }
 
   /**
@@ -636,6 +771,13 @@ export class GeneticAlgorithm {
     }
   }
 
+  /**
+   * RNG de la configuración: con semilla si se indicó, Math.random si no
+   */
+  private createRng(): () => number {
+    return this.config.seed !== undefined ? this.seededRandom(this.config.seed) : Math.random;
+  }
+
   /**
    * RNG con semilla
    */
@@ -99,13 +99,14 @@ export class OrchardLayoutExporter {
    */
   private static generateDescription(individual: Individual): string {
     const totalPlants = individual.plants.length;
-    const species = new Set(individual.plants.map(p => p.plant.species)).size;
+    // Especies únicas: el Set se construye una sola vez
+    const uniqueSpecies = new Set<string>();
+    for (const p of individual.plants) uniqueSpecies.add(p.plant.species);
+    const species = uniqueSpecies.size;
     const area = individual.dimensions.totalArea.toFixed(1);
     const fitness = (individual.fitness * 100).toFixed(1);
 
-    const speciesList = Array.from(new Set(individual.plants.map(p => p.plant.species)))
-      .slice(0, 3)
-      .join(', ');
+    const speciesList = Array.from(uniqueSpecies).slice(0, 3).join(', ');
 
     return `Huerto optimizado con ${totalPlants} plantas de ${species} especies diferentes (${speciesList}${species > 3 ? ', ...' : ''}). Área: ${area}m². Score de optimización: ${fitness}%.`;
   }
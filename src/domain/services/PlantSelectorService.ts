@@ -1,12 +1,13 @@
 import { Plant } from '../entities/Plant';
 import { Objective } from './FitnessCalculator';
+import { CompatibilityTable, COMPATIBILITY_SCALE } from '../value-objects/CompatibilityTable';
 
 export interface PlantSelectionConfig {
   desiredPlantIds?: number[]; // MEJORADO: IDs de plantas deseadas por el usuario
   maxSpecies: number; // Máximo de especies simultáneas (3 o 5)
   objective: Objective; // Objetivo del huerto
   season?: 'spring' | 'summer' | 'autumn' | 'winter' | 'auto';
-  compatibilityMatrix: Map<string, Map<string, number>>;
+  compatibilityMatrix: ReadonlyMap<string, ReadonlyMap<string, number>>;
 }
 
 export interface PlantScore {
@@ -27,7 +28,11 @@ export interface PlantScore {
  * 6. Considerar estacionalidad
  */
 export class PlantSelectorService {
-  constructor(private config: PlantSelectionConfig) {}
+  private readonly compatibility: CompatibilityTable;
+
+  constructor(private config: PlantSelectionConfig) {
+    this.compatibility = CompatibilityTable.for(config.compatibilityMatrix);
+  }
 
   /**
    * Selecciona las mejores N plantas para el huerto.
@@ -45,7 +50,8 @@ export class PlantSelectorService {
     }
 
     // PASO 3: Calcular scores para cada planta
-    const scored = candidates.map(plant => this.scorePlant(plant, candidates));
+    const compatScores = this.scoreByCompatibility(candidates);
+    const scored = candidates.map((plant, i) => this.scorePlant(plant, compatScores[i]));
 
     // PASO 4: Ordenar por score descendente
     scored.sort((a, b) => b.score - a.score);
@@ -83,7 +89,7 @@ export class PlantSelectorService {
   /**
    * Calcula score de una planta individual
    */
-  private scorePlant(plant: Plant, context: Plant[]): PlantScore {
+  private scorePlant(plant: Plant, compatScore: number): PlantScore {
     let score = 0;
     const reasons: string[] = [];
 
@@ -95,7 +101,6 @@ export class PlantSelectorService {
     }
 
     // CRITERIO 2: Compatibilidad promedio con otras candidatas (peso: 40%)
-    const compatScore = this.scoreByCompatibility(plant, context);
     score += compatScore * 0.4;
     if (compatScore > 0.6) {
       reasons.push('Alta compatibilidad con otras plantas');
@@ -121,10 +126,10 @@ export class PlantSelectorService {
   private scoreByObjective(plant: Plant): number {
     switch (this.config.objective) {
       case 'alimenticio':
-        return plant.hasType('vegetable') ? 1.0 : 0.3;
+        return plant.isEdible() ? 1.0 : 0.3;
 
       case 'medicinal':
-        return plant.hasType('medicinal') ? 1.0 : plant.hasType('aromatic') ? 0.6 : 0.2;
+        return plant.isMedicinal() ? 1.0 : plant.isAromatic() ? 0.6 : 0.2;
 
       case 'sostenible':
         // Priorizar plantas de bajo consumo de agua
@@ -132,7 +137,7 @@ export class PlantSelectorService {
         return waterEfficiency;
 
       case 'ornamental':
-        return plant.hasType('ornamental') ? 1.0 : plant.hasType('aromatic') ? 0.5 : 0.2;
+        return plant.isOrnamental() ? 1.0 : plant.isAromatic() ? 0.5 : 0.2;
 
       default:
         return 0.5;
@@ -140,42 +145,54 @@ export class PlantSelectorService {
   }
 
   /**
-   * Score por compatibilidad con otras plantas
+   * Score por compatibilidad de cada candidata con las demás.
+   *
+   * Recorre solo el triángulo superior de parejas (i < j) y acumula en cada
+   * planta el score de su propia orientación (i → j para i, j → i para j),
+   * de modo que una matriz asimétrica puntúa igual que consultando cada
+   * planta por separado. Las parejas se leen directamente de la tabla y los
+   * totales se acumulan en su escala entera.
    */
-  private scoreByCompatibility(plant: Plant, others: Plant[]): number {
-    if (others.length <= 1) {
-      return 1.0; // Sin contexto, score neutro
-    }
-
-    let totalCompatibility = 0;
-    let count = 0;
+  private scoreByCompatibility(candidates: Plant[]): number[] {
+    const n = candidates.length;
 
-    for (const other of others) {
-      if (other.species === plant.species) continue;
-
-      const compat = this.getCompatibility(plant.species, other.species);
-      totalCompatibility += compat;
-      count++;
+    if (n <= 1) {
+      return new Array(n).fill(1.0); // Sin contexto, score neutro
     }
 
-    if (count === 0) return 1.0;
+    const scores = this.compatibility.scores;
+    const stride = this.compatibility.stride;
+    const totals = new Int32Array(n);
+    const counts = new Int32Array(n);
 
-    // Normalizar de [-1, 1] a [0, 1]
-    const avgCompat = totalCompatibility / count;
-    return (avgCompat + 1) / 2;
-  }
+    // Índice de especie resuelto una vez por candidata
+    const speciesOf = new Int32Array(n);
+    for (let i = 0; i < n; i++) {
+      speciesOf[i] = this.compatibility.indexOf(candidates[i].species);
+    }
 
-  /**
-   * Obtiene compatibilidad entre dos especies
-   */
-  private getCompatibility(species1: string, species2: string): number {
-    const score1 = this.config.compatibilityMatrix.get(species1)?.get(species2);
-    if (score1 !== undefined) return score1;
+    for (let i = 0; i < n; i++) {
+      const species1 = candidates[i].species;
+      const species1Index = speciesOf[i];
+      const row = species1Index * stride;
+      for (let j = i + 1; j < n; j++) {
+        if (species1 === candidates[j].species) continue;
+
+        totals[i] += scores[row + speciesOf[j]];
+        totals[j] += scores[speciesOf[j] * stride + species1Index];
+        counts[i]++;
+        counts[j]++;
+      }
+    }
 
-    const score2 = this.config.compatibilityMatrix.get(species2)?.get(species1);
-    if (score2 !== undefined) return score2;
+    const result: number[] = new Array(n);
+    for (let i = 0; i < n; i++) {
+      // Normalizar de [-1, 1] a [0, 1]
+      result[i] =
+        counts[i] === 0 ? 1.0 : (totals[i] / (counts[i] * COMPATIBILITY_SCALE) + 1) / 2;
+    }
 
-    return 0; // Neutral si no hay datos
+    return result;
   }
 
   /**
@@ -218,10 +235,13 @@ export class PlantSelectorService {
 
     // Si no se alcanzó el máximo, agregar las mejor rankeadas sin importar compatibilidad
     if (selected.length < maxSpecies) {
+      // Set de ya elegidas: consulta O(1) en lugar de recorrer `selected`
+      const selectedSet = new Set<Plant>(selected);
       for (const candidate of scored) {
         if (selected.length >= maxSpecies) break;
-        if (!selected.includes(candidate.plant)) {
+        if (!selectedSet.has(candidate.plant)) {
           selected.push(candidate.plant);
+          selectedSet.add(candidate.plant);
         }
       }
     }
@@ -237,8 +257,11 @@ export class PlantSelectorService {
 
     let negativeCount = 0;
 
+    // La especie de la planta se resuelve una vez; solo cambia la columna
+    const index = this.compatibility.indexOf(plant.species);
+
     for (const other of selected) {
-      const compat = this.getCompatibility(plant.species, other.species);
+      const compat = this.compatibility.scoreAt(index, this.compatibility.indexOf(other.species));
       if (compat < -0.3) {
         // Compatibilidad muy negativa
         negativeCount++;
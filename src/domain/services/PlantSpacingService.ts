@@ -10,11 +10,11 @@
 import { Plant } from '../entities/Plant';
 
 export interface SpacingConfig {
-  compatibilityMatrix?: Map<string, Map<string, number>>;
+  compatibilityMatrix?: ReadonlyMap<string, ReadonlyMap<string, number>>;
 }
 
 export class PlantSpacingService {
-  private compatibilityMatrix: Map<string, Map<string, number>>;
+  private compatibilityMatrix: ReadonlyMap<string, ReadonlyMap<string, number>>;
 
   constructor(config?: SpacingConfig) {
     this.compatibilityMatrix = config?.compatibilityMatrix || new Map();
@@ -43,8 +43,8 @@ export class PlantSpacingService {
     }
 
     // Agregar el radio de ambas plantas para evitar solapamiento físico
-    const radius1 = Math.sqrt(plant1.size) / 2;
-    const radius2 = Math.sqrt(plant2.size) / 2;
+    const radius1 = plant1.sideLength / 2;
+    const radius2 = plant2.sideLength / 2;
 
     return baseDistance + radius1 + radius2;
   }
@@ -22,9 +22,9 @@ export interface ValidationConstraints {
  */
 export class ValidationService {
   private plants: Plant[];
-  private compatibilityMatrix: Map<string, Map<string, number>>;
+  private compatibilityMatrix: ReadonlyMap<string, ReadonlyMap<string, number>>;
 
-  constructor(plants: Plant[], compatibilityMatrix: Map<string, Map<string, number>>) {
+  constructor(plants: Plant[], compatibilityMatrix: ReadonlyMap<string, ReadonlyMap<string, number>>) {
     this.plants = plants;
     this.compatibilityMatrix = compatibilityMatrix;
   }
@@ -0,0 +1,103 @@
+type CompatibilityMatrix = ReadonlyMap<string, ReadonlyMap<string, number>>;
+
+/**
+ * Factor de cuantización: los scores (en [-1, 1]) se guardan como enteros
+ * en centésimas, que caben en un Int8Array (-100..100).
+ */
+export const COMPATIBILITY_SCALE = 100;
+
+/**
+ * Tablas ya construidas por matriz de origen. El repositorio devuelve la
+ * misma matriz cacheada en cada petición, así que la tabla se arma una sola
+ * vez por proceso; si la matriz se descarta, su tabla también.
+ */
+const tablesByMatrix = new WeakMap<CompatibilityMatrix, CompatibilityTable>();
+
+/**
+ * Tabla densa de compatibilidad entre especies.
+ *
+ * Cada especie se traduce una sola vez a un índice entero y los scores se
+ * guardan cuantizados en un Int8Array fila por fila (un byte por pareja),
+ * de modo que consultar una pareja es un acceso por índice en lugar de dos
+ * búsquedas en Maps anidados. Resolución: 0.01.
+ *
+ * La última fila/columna (índice `unknownIndex`) es neutra (0) y representa
+ * a cualquier especie sin datos en la matriz.
+ */
+export class CompatibilityTable {
+  public readonly speciesCount: number;
+  public readonly unknownIndex: number;
+  public readonly stride: number;
+  /**
+   * Scores × COMPATIBILITY_SCALE
+   */
+  public readonly scores: Int8Array;
+  private readonly index: Map<string, number>;
+
+  /**
+   * Tabla para la matriz dada, reutilizando la ya construida si existe.
+   */
+  static for(matrix: CompatibilityMatrix): CompatibilityTable {
+    let table = tablesByMatrix.get(matrix);
+    if (!table) {
+      table = new CompatibilityTable(matrix);
+      tablesByMatrix.set(matrix, table);
+    }
+    return table;
+  }
+
+  constructor(matrix: CompatibilityMatrix) {
+    this.index = new Map();
+
+    matrix.forEach((row, species1) => {
+      this.register(species1);
+      row.forEach((_score, species2) => this.register(species2));
+    });
+
+    this.speciesCount = this.index.size;
+    this.unknownIndex = this.speciesCount;
+    this.stride = this.speciesCount + 1;
+    this.scores = new Int8Array(this.stride * this.stride);
+
+    // La entrada directa (species1 → species2) tiene prioridad; la inversa
+    // solo se usa si la matriz no define esa orientación
+    matrix.forEach((row, species1) => {
+      const i = this.index.get(species1)!;
+      row.forEach((score, species2) => {
+        const j = this.index.get(species2)!;
+        const quantized = Math.round(score * COMPATIBILITY_SCALE);
+        this.scores[i * this.stride + j] = quantized;
+        if (!matrix.get(species2)?.has(species1)) {
+          this.scores[j * this.stride + i] = quantized;
+        }
+      });
+    });
+  }
+
+  /**
+   * Índice de la especie en la tabla, o `unknownIndex` si no tiene datos.
+   */
+  indexOf(species: string): number {
+    return this.index.get(species) ?? this.unknownIndex;
+  }
+
+  /**
+   * Score entre dos índices obtenidos con indexOf.
+   */
+  scoreAt(index1: number, index2: number): number {
+    return this.scores[index1 * this.stride + index2] / COMPATIBILITY_SCALE;
+  }
+
+  /**
+   * Score entre dos especies (0 = neutral si no hay datos).
+   */
+  getScore(species1: string, species2: string): number {
+    return this.scoreAt(this.indexOf(species1), this.indexOf(species2));
+  }
+
+  private register(species: string): void {
+    if (!this.index.has(species)) {
+      this.index.set(species, this.index.size);
+    }
+  }
+}
@@ -24,7 +24,9 @@ export class Metrics {
   }
 
   private validateMetric(value: number, name: string): number {
-    if (value < 0 || value > 1) {
+    // NaN no cumple ninguna comparación: se rechaza explícitamente para que
+    // no llegue al fitness ni a la selección
+    if (Number.isNaN(value) || value < 0 || value > 1) {
       throw new Error(`${name} must be between 0 and 1, got ${value}`);
     }
     return value;
@@ -9,9 +9,9 @@ export class Position {
   }
 
   distanceTo(other: Position): number {
-    return Math.sqrt(
-      Math.pow(this.x - other.x, 2) + Math.pow(this.y - other.y, 2)
-    );
+    const dx = this.x - other.x;
+    const dy = this.y - other.y;
+    return Math.sqrt(dx * dx + dy * dy);
   }
 
   toJSON() {
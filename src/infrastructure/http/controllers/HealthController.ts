@@ -16,8 +16,11 @@ export class HealthController {
       let collections = { plants: 0, matrix: 0 };
 
       if (dbConnected) {
-        collections.plants = await this.plantRepository.count();
-        collections.matrix = await this.compatibilityMatrixRepository.count();
+        const [plants, matrix] = await Promise.all([
+          this.plantRepository.count(),
+          this.compatibilityMatrixRepository.count(),
+        ]);
+        collections = { plants, matrix };
       }
 
       res.status(200).json({
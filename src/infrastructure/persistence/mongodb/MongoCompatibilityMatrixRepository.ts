@@ -2,7 +2,13 @@ import { CompatibilityMatrixRepository, CompatibilityEntry } from '../../../doma
 import { CompatibilityMatrixModel } from './schemas/CompatibilityMatrixSchema';
 
 export class MongoCompatibilityMatrixRepository implements CompatibilityMatrixRepository {
-  private cache: Map<string, Map<string, number>> | null = null;
+  private cache: ReadonlyMap<string, ReadonlyMap<string, number>> | null = null;
+  private loading: Promise<ReadonlyMap<string, ReadonlyMap<string, number>>> | null = null;
+  /**
+   * Se incrementa en cada invalidación: una carga iniciada antes de
+   * invalidar no debe volver a cachear la matriz vieja
+   */
+  private generation = 0;
 
   async getCompatibility(plant1: string, plant2: string): Promise<number> {
     // Intentar desde cache primero
@@ -27,14 +33,35 @@ export class MongoCompatibilityMatrixRepository implements CompatibilityMatrixRe
     return 0;
   }
 
-  async getAllCompatibilities(): Promise<Map<string, Map<string, number>>> {
+  async getAllCompatibilities(): Promise<ReadonlyMap<string, ReadonlyMap<string, number>>> {
     // Si ya tenemos cache, retornarlo
     if (this.cache) {
       return this.cache;
     }
 
-    // Cargar toda la matriz
-    const entries = await CompatibilityMatrixModel.find().exec();
+    // Una sola carga en curso: peticiones concurrentes comparten la misma
+    // matriz (y por lo tanto la misma tabla densa) en lugar de cargar copias
+    if (!this.loading) {
+      const loading = this.loadAllCompatibilities().finally(() => {
+        // Solo limpiar si no fue reemplazada por una carga posterior
+        if (this.loading === loading) {
+          this.loading = null;
+        }
+      });
+      this.loading = loading;
+    }
+
+    return this.loading;
+  }
+
+  private async loadAllCompatibilities(): Promise<ReadonlyMap<string, ReadonlyMap<string, number>>> {
+    const generation = this.generation;
+
+    // Cargar toda la matriz: solo los campos usados y como objetos planos
+    // (lean), sin hidratar un documento de Mongoose por entrada
+    const entries = await CompatibilityMatrixModel.find({}, { plant1: 1, plant2: 1, score: 1, _id: 0 })
+      .lean<CompatibilityEntry[]>()
+      .exec();
 
     const matrix = new Map<string, Map<string, number>>();
 
@@ -45,8 +72,12 @@ export class MongoCompatibilityMatrixRepository implements CompatibilityMatrixRe
       matrix.get(entry.plant1)!.set(entry.plant2, entry.score);
     });
 
-    // Cachear para futuras consultas
-    this.cache = matrix;
+    // Cachear para futuras consultas; se expone como solo lectura porque la
+    // misma instancia se comparte entre todas las peticiones. Si el cache se
+    // invalidó durante la carga, el resultado puede estar desactualizado
+    if (generation === this.generation) {
+      this.cache = matrix;
+    }
 
     return matrix;
   }
@@ -65,10 +96,20 @@ export class MongoCompatibilityMatrixRepository implements CompatibilityMatrixRe
     await CompatibilityMatrixModel.insertMany(docs);
 
     // Invalidar cache
-    this.cache = null;
+    this.invalidate();
   }
 
   clearCache(): void {
+    this.invalidate();
+  }
+
+  /**
+   * Descarta el cache y la carga en curso; las siguientes consultas
+   * vuelven a leer la base de datos
+   */
+  private invalidate(): void {
+    this.generation++;
     this.cache = null;
+    this.loading = null;
   }
 }
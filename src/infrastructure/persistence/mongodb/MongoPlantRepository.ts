@@ -1,9 +1,9 @@
 import { PlantRepository } from '../../../domain/repositories/PlantRepository';
-import { Plant } from '../../../domain/entities/Plant';
-import { PlantModel, PlantDocument } from './schemas/PlantSchema';
+import { Plant, PlantProps } from '../../../domain/entities/Plant';
+import { PlantModel } from './schemas/PlantSchema';
 
 export class MongoPlantRepository implements PlantRepository {
-  private toDomain(doc: PlantDocument): Plant {
+  private toDomain(doc: PlantProps): Plant {
     return new Plant({
       id: doc.id,
       species: doc.species,
@@ -20,22 +20,24 @@ export class MongoPlantRepository implements PlantRepository {
   }
 
   async findAll(): Promise<Plant[]> {
-    const docs = await PlantModel.find().sort({ id: 1 }).exec();
+    // Catálogo completo como objetos planos (lean): no se hidrata un
+    // documento de Mongoose por planta solo para copiar sus campos
+    const docs = await PlantModel.find().sort({ id: 1 }).lean<PlantProps[]>().exec();
     return docs.map(doc => this.toDomain(doc));
   }
 
   async findById(id: number): Promise<Plant | null> {
-    const doc = await PlantModel.findOne({ id }).exec();
+    const doc = await PlantModel.findOne({ id }).lean<PlantProps>().exec();
     return doc ? this.toDomain(doc) : null;
   }
 
   async findBySpecies(species: string): Promise<Plant | null> {
-    const doc = await PlantModel.findOne({ species }).exec();
+    const doc = await PlantModel.findOne({ species }).lean<PlantProps>().exec();
     return doc ? this.toDomain(doc) : null;
   }
 
   async findByType(type: string): Promise<Plant[]> {
-    const docs = await PlantModel.find({ type }).exec();
+    const docs = await PlantModel.find({ type }).lean<PlantProps[]>().exec();
     return docs.map(doc => this.toDomain(doc));
   }
 
@@ -16,8 +16,10 @@ export class DataSeeder {
       logger.info('Iniciando seed de datos...');
 
       // Verificar si ya existen datos
-      const plantsCount = await this.plantRepository.count();
-      const matrixCount = await this.compatibilityMatrixRepository.count();
+      const [plantsCount, matrixCount] = await Promise.all([
+        this.plantRepository.count(),
+        this.compatibilityMatrixRepository.count(),
+      ]);
 
       if (plantsCount > 0 && matrixCount > 0) {
         logger.info('Datos ya existentes en BD, omitiendo seed');
@@ -47,13 +49,11 @@ export class DataSeeder {
   private async seedPlants(): Promise<void> {
     const plantsPath = path.join(__dirname, '../../../../data/plants_with_id.json');
 
-    if (!fs.existsSync(plantsPath)) {
-      logger.warn(`Archivo no encontrado: ${plantsPath}`);
+    const plantsData = await this.readJsonFile(plantsPath);
+    if (plantsData === null) {
       return;
     }
 
-    const plantsData = JSON.parse(fs.readFileSync(plantsPath, 'utf-8'));
-
     const plants = plantsData.map((p: any) => new Plant({
       id: p.id,
       species: p.species,
@@ -76,13 +76,11 @@ export class DataSeeder {
   private async seedCompatibilityMatrix(): Promise<void> {
     const matrixPath = path.join(__dirname, '../../../../data/matriz_compatibilities.json');
 
-    if (!fs.existsSync(matrixPath)) {
-      logger.warn(`Archivo no encontrado: ${matrixPath}`);
+    const matrixData = await this.readJsonFile(matrixPath);
+    if (matrixData === null) {
       return;
     }
 
-    const matrixData = JSON.parse(fs.readFileSync(matrixPath, 'utf-8'));
-
     const entries: CompatibilityEntry[] = [];
 
     Object.entries(matrixData).forEach(([plant1, compatibilities]) => {
@@ -99,4 +97,20 @@ export class DataSeeder {
 
     logger.info(`${entries.length} entradas de compatibilidad cargadas en BD`);
   }
+
+  /**
+   * Lee y parsea un archivo JSON de forma asíncrona, sin bloquear el event
+   * loop. Retorna null (con advertencia) si el archivo no existe.
+   */
+  private async readJsonFile(filePath: string): Promise<any> {
+    try {
+      return JSON.parse(await fs.promises.readFile(filePath, 'utf-8'));
+    } catch (error) {
+      if ((error as NodeJS.ErrnoException).code === 'ENOENT') {
+        logger.warn(`Archivo no encontrado: ${filePath}`);
+        return null;
+      }
+      throw error;
+    }
+  }
 }